@@ -17,6 +17,9 @@ import undefined
 import abc
 from typing import List, Union
 
+# Classes used to create new cache instances
+_implementations = {}
+
 class Cache(abc.ABC):
 	"""Cache
 
@@ -26,9 +29,6 @@ class Cache(abc.ABC):
 		abc.ABC
 	"""
 
-	__implementations = {}
-	"""Classes used to create new cache instances"""
-
 	def __init__(self, name: str, conf: dict):
 		"""Constructor
 
@@ -113,11 +113,16 @@ class Cache(abc.ABC):
 			Cache
 		"""
 
+		# Get the implementation and the class associated with it
+		sImplementation = conf['implementation']
+		oClass = _implementations.get(sImplementation)
+
+		# If it doesn't exist
+		if oClass is None:
+			raise ValueError(sImplementation, 'not registered')
+
 		# Create the instance by calling the implementation
-		try:
-			return cls.__implementations[conf['implementation']](name, conf)
-		except KeyError:
-			raise ValueError(conf['implementation'], 'not registered')
+		return oClass(name, conf)
 
 	@abc.abstractmethod
 	def get(self,
@@ -163,11 +168,11 @@ class Cache(abc.ABC):
 		"""
 
 		# If the name already exists
-		if implementation in cls.__implementations:
+		if implementation in _implementations:
 			raise ValueError(implementation, 'already registered')
 
 		# Store the new constructor
-		cls.__implementations[implementation] = cls
+		_implementations[implementation] = cls
 
 	@abc.abstractmethod
 	def set(self,
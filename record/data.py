@@ -15,11 +15,11 @@ __all__ = ['Data']
 
 # Ouroboros imports
 import undefined
-from tools import clone, compare, merge
+from tools import compare, merge
 
 # Python imports
 import abc
-from copy import copy
+from copy import copy, deepcopy
 
 # Local imports
 import record
@@ -33,6 +33,10 @@ class Data(abc.ABC):
 	Represents record data
 	"""
 
+	__slots__ = ('_changes', '_errors', '_overwrite', '_storage', '_value')
+	"""Instance variables, kept in slots instead of a per instance dict. Child \
+	classes should declare their own __slots__, even if empty, to keep this"""
+
 	def __init__(self, storage: record.Storage, value: dict = {}):
 		"""Constructor
 
@@ -73,7 +77,7 @@ class Data(abc.ABC):
 			return default
 
 		# Return a copy of the data
-		return clone(self._value)
+		return deepcopy(self._value)
 
 	def __contains__(self, key):
 		"""Contains
@@ -106,6 +110,13 @@ class Data(abc.ABC):
 		Returns:
 			any
 		"""
+
+		# If the value itself hasn't been set yet, don't look for it in the
+		#	value, or we'll recurse forever
+		if name == '_value':
+			raise AttributeError(name)
+
+		# Return a copy of the value
 		try:
 			return copy(self._value[name])
 		except KeyError:
@@ -175,11 +186,12 @@ class Data(abc.ABC):
 		"""
 
 		# Add the record and store the ID
-		self._value[self._storage._key] = self._storage.add(
+		sID = self._storage.add(
 			self._value,
 			conflict,
 			revision
 		)
+		self._value[self._storage._key] = sID
 
 		# Clear changes and other flags
 		self._changes = None
@@ -187,17 +199,35 @@ class Data(abc.ABC):
 		self._overwrite = False
 
 		# Return the ID
-		return self._value[self._storage._key]
+		return sID
 
-	def changed(self) -> bool:
+	def changed(self, field: str = undefined) -> bool:
 		"""Changed
 
-		Returns whether the data has been changed at all
+		Returns whether the data has been changed at all, or, if a field is \
+		passed, whether that specific field has been changed. Once the data \
+		is set to be overwritten, by set() or setting a field directly, the \
+		entire record will be replaced on save, so every field is considered \
+		changed. This is conservative, any field name passed, even one not \
+		in the record, returns True in that state
+
+		Arguments:
+			field (str): Optional, the name of the field to check
 
 		Returns:
 			bool
 		"""
-		return self._changes and True or False
+
+		# If we are overwriting, everything has changed
+		if self._overwrite:
+			return True
+
+		# If there's no changes, nothing has changed
+		if not self._changes:
+			return False
+
+		# If there's no field, something changed, else check for the field
+		return field is undefined or field in self._changes
 
 	def changes(self) -> dict | None:
 		"""Changes
@@ -207,7 +237,7 @@ class Data(abc.ABC):
 		Returns:
 			dict | None
 		"""
-		return clone(self._changes)
+		return deepcopy(self._changes)
 
 	def clean(self) -> None:
 		"""Clean
@@ -223,13 +253,13 @@ class Data(abc.ABC):
 		self._value = self._storage.clean(self._value)
 
 	@property
-	def errors(self) -> list[list[str]]:
+	def errors(self) -> tuple[list[str], ...] | None:
 		"""Errors
 
-		Read only property that returns the list of errors from the last \
-		failed valid call
+		Read only property that returns the tuple of [field, error] lists from \
+		the last failed valid call
 		"""
-		return copy(self._errors)
+		return self._errors
 
 	def remove(self, revision_info: dict = undefined) -> bool:
 		"""Remove
@@ -244,7 +274,7 @@ class Data(abc.ABC):
 			True on success
 		"""
 		return self._storage.remove(
-			self._value['_id'],
+			self._value[self._storage._key],
 			revision_info = revision_info
 		)
 
@@ -265,12 +295,15 @@ class Data(abc.ABC):
 			True on success
 		"""
 
+		# Get the ID of the record
+		sID = self._value[self._storage._key]
+
 		# If we are replacing the entire record
 		if self._overwrite:
 
 			# Pass the current value to the storage's save method
 			result = self._storage.save(
-				self._value[self._storage._key],
+				sID,
 				self._value,
 				True,
 				revision_info,
@@ -282,7 +315,7 @@ class Data(abc.ABC):
 
 			# Pass the changes to the storage's save method
 			result = self._storage.save(
-				self._value[self._storage._key],
+				sID,
 				self._changes,
 				False,
 				revision_info,
@@ -332,8 +365,9 @@ class Data(abc.ABC):
 			value (any): The value to set
 		"""
 
-		# If there's no difference, do nothing
-		if compare(self._value[key], value):
+		# If the key already exists and there's no difference, do nothing
+		mCurrent = self._value.get(key, undefined)
+		if mCurrent is not undefined and compare(mCurrent, value):
 			return
 
 		# Set the value
@@ -405,7 +439,7 @@ class Data(abc.ABC):
 
 		# If the data isn't valid, store the errors locally and return False
 		if bRes is False:
-			self._errors = self._storage.validation_failures
+			self._errors = tuple(self._storage.validation_failures)
 			return False
 
 		# Return OK
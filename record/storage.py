@@ -18,6 +18,7 @@ import undefined
 
 # Python imports
 import abc
+from collections import deque
 from typing import List, Literal
 
 # Local imports
@@ -246,106 +247,154 @@ class Storage(Tree, abc.ABC):
 			dict | None
 		"""
 
-		# If we are dealing with a dict
-		if isinstance(old, dict):
-
-			# If the new is not also a dict
-			if not isinstance(new, dict):
-				return { 'old': old, 'new': new }
-
-			# Both are dicts, create a new dict to return
-			dRet = {}
-
-			# Get the length of keys in old
-			iOldLen = len(old.keys())
-
-			# Store the keys from new and get the length
-			lNewKeys = list(new.keys())
-			iNewLen = len(lNewKeys)
-
-			# Start checking keys from old
-			for k in old:
-
-				# If the key doesn't exist in new
-				if k not in new:
-					dRet[k] = { 'old': old[k], 'new': None }
+		# Init the dict the final result will be stored in
+		dRet = {}
+
+		# Init the stack of frames waiting on their children to be compared
+		oStack = deque()
+
+		# Start with a frame holding only the two records themselves. Each
+		#	frame is made up of the old and new values, whether they are dicts
+		#	or lists, the dict of changes found so far, an iterator over the
+		#	keys, or indexes, and values in old, and the key the changes will
+		#	be stored under in the parent. Children are only pulled from the
+		#	iterators as they are compared, so the stack never holds more than
+		#	one path through the data
+		mFrameOld = { 'root': old }
+		mFrameNew = { 'root': new }
+		bFrameDict = True
+		dChanges = dRet
+		oChildren = iter(mFrameOld.items())
+		sFrameKey = None
+
+		# Loop until there's nothing left to compare
+		while True:
+
+			# Get the next child from the frame
+			tChild = next(oChildren, None)
+
+			# If there's no more children
+			if tChild is None:
+
+				# If it's the first frame, we're done
+				if not oStack:
+					break
+
+				# If it's a dict, add any keys only found in new
+				if bFrameDict:
+					if not mFrameNew.keys() <= mFrameOld.keys():
+						for k in mFrameNew:
+							if k not in mFrameOld:
+								dChanges[k] = { 'old': None, 'new': mFrameNew[k] }
+
+				# Else, it's a list, add any indexes only found in new
+				else:
+					for i in range(len(mFrameOld), len(mFrameNew)):
+						dChanges[str(i)] = { 'old': None, 'new': mFrameNew[i] }
+
+				# If there's changes, and the number of keys that are different
+				#	match the total number of keys, set everything as changed,
+				#	else keep the changes, if there are any
+				if dChanges and \
+					len(dChanges) >= max(len(mFrameOld), len(mFrameNew)):
+					dFrame = { 'old': mFrameOld, 'new': mFrameNew }
+				else:
+					dFrame = dChanges
+
+				# Go back to the parent frame and store the changes in it
+				sKey = sFrameKey
+				mFrameOld, mFrameNew, bFrameDict, dChanges, oChildren, \
+					sFrameKey = oStack.pop()
+				if dFrame:
+					dChanges[sKey] = dFrame
+
+				# Move to the next child
+				continue
+
+			# Get the key and old value of the child, and the new value if it
+			#	exists
+			sKey, mOld = tChild
+			if bFrameDict:
+				mNew = mFrameNew.get(sKey, undefined)
+			else:
+				try:
+					mNew = mFrameNew[sKey]
+				except IndexError:
+					mNew = undefined
+				sKey = str(sKey)
+
+			# If the two are the same object, there's no changes
+			if mOld is mNew:
+				continue
+
+			# If the key doesn't exist in new
+			if mNew is undefined:
+				dChanges[sKey] = { 'old': mOld, 'new': None }
+				continue
+
+			# If we are dealing with a dict
+			if isinstance(mOld, dict):
+
+				# If the new is not also a dict
+				if not isinstance(mNew, dict):
+					dChanges[sKey] = { 'old': mOld, 'new': mNew }
 					continue
 
-				# It exists in both so pass the two along and remove the key
-				#	from the new list
-				dTemp = cls.generate_changes(old[k], new[k])
-				lNewKeys.remove(k)
-
-				# If there's a value, store it
-				if dTemp:
-					dRet[k] = dTemp
-
-			# If there's any keys left in the new list
-			if lNewKeys:
-				for k in lNewKeys:
-					dRet[k] = { 'old': None, 'new': new[k] }
-
-			# If the number of keys that are different match the total number of
-			#	keys, set everything as changed
-			iMaxKeys = iOldLen > iNewLen and iOldLen or iNewLen
-			if len(dRet.keys()) >= iMaxKeys:
-				return { 'old': old, 'new': new }
-
-			# Return the changes if there are any
-			if dRet:
-				return dRet
-
-		# Else if we are dealing with a list
-		elif isinstance(old, list):
+			# Else if we are dealing with a list
+			elif isinstance(mOld, list):
 
-			# If the new is not also a list
-			if not isinstance(new, list):
-				return { 'old': old, 'new': new }
-
-			# Both are lists, create a new dict to return
-			dRet = {}
-
-			# Get the length of the old and new
-			iOldLen = len(old)
-			iNewLen = len(new)
-
-			# Start going through the indexes of the old
-			for i in range(iOldLen):
-
-				# If it's not in the new
-				if i >= iNewLen:
-					dRet[str(i)] = { 'old': old[i], 'new': None }
+				# If the new is not also a list
+				if not isinstance(mNew, list):
+					dChanges[sKey] = { 'old': mOld, 'new': mNew }
 					continue
 
-				# It exists in both so pass the two along
-				dTemp = cls.generate_changes(old[i], new[i])
-
-				# If there's a value, store it
-				if dTemp: dRet[str(i)] = dTemp
-
-			# If there's more new indexes than old
-			if iNewLen > iOldLen:
-				for i in range(iOldLen, iNewLen):
-					dRet[str(i)] = { 'old': None, 'new': new[i] }
-
-			# If the number of indexes different match all data, set everything
-			#	as changed
-			iMaxKeys = iOldLen > iNewLen and iOldLen or iNewLen
-			if len(dRet.keys()) >= iMaxKeys:
-				return { 'old': old, 'new': new }
-
-			# Return the changes if there are any
-			if dRet: return dRet
-
-		# Else it's a single value
-		else:
-
-			# If the new is a dict or list or the values don't match
-			if isinstance(new, (dict,list)) or new != old:
-				return { 'old': old, 'new': new }
-
-		# No changes
-		return None
+			# Else it's a single value, if the comparison fails or they don't
+			#	match, mark it as changed
+			else:
+				try:
+					if mOld == mNew:
+						continue
+				except Exception:
+					pass
+				dChanges[sKey] = { 'old': mOld, 'new': mNew }
+				continue
+
+			# Both are dicts or lists. If it's the record itself, or one of its
+			#	fields, check if they hold the same data. When they do, this is
+			#	much faster than walking them. When they don't, the comparison
+			#	has scanned data that will now be walked anyway, so in the worst
+			#	case, every field changed, each field is scanned one extra time.
+			#	Nothing below a failed field is compared, otherwise every level
+			#	of a changed path would rescan all the levels below it. If the
+			#	comparison itself fails, they are walked
+			if len(oStack) < 2:
+				try:
+					if mOld == mNew:
+						continue
+				except Exception:
+					pass
+
+			# Add the frame to the stack and start on the new one
+			oStack.append(
+				(mFrameOld, mFrameNew, bFrameDict, dChanges, oChildren, sFrameKey)
+			)
+			mFrameOld = mOld
+			mFrameNew = mNew
+			dChanges = {}
+			sFrameKey = sKey
+
+			# If it's a dict, go through each key and value in old
+			if isinstance(mOld, dict):
+				bFrameDict = True
+				oChildren = iter(mOld.items())
+
+			# Else it's a list, go through each index and value in old
+			else:
+				bFrameDict = False
+				oChildren = enumerate(mOld)
+
+		# Return the changes if there are any
+		return dRet.get('root')
 
 	@abc.abstractmethod
 	def save(self,
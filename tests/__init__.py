@@ -0,0 +1,10 @@
+# coding=utf8
+"""Record Tests
+
+Unit tests for the record module
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-15"
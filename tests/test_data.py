@@ -0,0 +1,135 @@
+# coding=utf8
+"""Test Data
+
+Tests the methods of the Data class that don't rely on a Storage \
+implementation
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-15"
+
+# Python imports
+import copy
+import pickle
+import unittest
+
+# Local imports
+from record import Data
+
+class Changed(unittest.TestCase):
+	"""Changed
+
+	Tests Data.changed
+	"""
+
+	def test_unchanged(self):
+		"""Unchanged
+
+		Makes sure new data, and updates with the same values, are not \
+		marked as changed
+		"""
+
+		oData = Data(None, { '_id': '1', 'a': 1, 'b': { 'c': 2 } })
+		self.assertFalse(oData.changed())
+		self.assertFalse(oData.changed('a'))
+
+		oData.update({ 'a': 1, 'b': { 'c': 2 } })
+		self.assertFalse(oData.changed())
+		self.assertFalse(oData.changed('a'))
+
+	def test_update(self):
+		"""Update
+
+		Makes sure fields changed via update are the only ones marked as \
+		changed
+		"""
+
+		oData = Data(None, { '_id': '1', 'a': 1, 'b': { 'c': 2 } })
+		oData.update({ 'b': { 'c': 3 } })
+		self.assertTrue(oData.changed())
+		self.assertTrue(oData.changed('b'))
+		self.assertFalse(oData.changed('a'))
+
+	def test_overwrite(self):
+		"""Overwrite
+
+		Makes sure every field is marked as changed once the data is set to \
+		be overwritten, including by updates made after that
+		"""
+
+		# Setting a field directly
+		oData = Data(None, { '_id': '1', 'a': 1 })
+		oData['b'] = 2
+		self.assertTrue(oData.changed())
+		self.assertTrue(oData.changed('b'))
+		self.assertTrue(oData.changed('a'))
+
+		# Updating after setting a field directly
+		oData = Data(None, { '_id': '1', 'a': 1 })
+		oData['b'] = 2
+		oData.update({ 'a': 3 })
+		self.assertTrue(oData.changed('a'))
+
+		# Setting the entire value
+		oData = Data(None, { '_id': '1', 'a': 1 })
+		oData.set({ '_id': '1', 'a': 2 })
+		self.assertTrue(oData.changed())
+		self.assertTrue(oData.changed('a'))
+
+		# Fields not in the record are also considered changed
+		self.assertTrue(oData.changed('z'))
+
+class Errors(unittest.TestCase):
+	"""Errors
+
+	Tests Data.errors
+	"""
+
+	class Storage(object):
+		"""Storage
+
+		Minimal stand in for a Storage instance that always fails validation
+		"""
+
+		validation_failures = [ [ 'a', 'invalid' ], [ 'b', 'missing' ] ]
+
+		def valid(self, value, ignore_missing = False):
+			return False
+
+	def test_tuple(self):
+		"""Tuple
+
+		Makes sure a failed valid call stores the failures as a tuple, and \
+		errors returns it
+		"""
+
+		oData = Data(self.Storage(), { '_id': '1', 'a': 1 })
+		self.assertIsNone(oData.errors)
+		oData.update({ 'a': 2 })
+		self.assertFalse(oData.valid())
+		self.assertIsInstance(oData.errors, tuple)
+		self.assertEqual(
+			oData.errors,
+			( [ 'a', 'invalid' ], [ 'b', 'missing' ] )
+		)
+
+class Copy(unittest.TestCase):
+	"""Copy
+
+	Tests copying and pickling Data instances
+	"""
+
+	def test_copy(self):
+		"""Copy
+
+		Makes sure copy, deepcopy, and a pickle round trip all keep the value
+		"""
+
+		dValue = { '_id': '1', 'a': 1, 'b': { 'c': [ 1, 2 ] } }
+		oData = Data(None, copy.deepcopy(dValue))
+
+		self.assertEqual(copy.copy(oData)(), dValue)
+		self.assertEqual(copy.deepcopy(oData)(), dValue)
+		self.assertEqual(pickle.loads(pickle.dumps(oData))(), dValue)
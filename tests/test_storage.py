@@ -0,0 +1,222 @@
+# coding=utf8
+"""Test Storage
+
+Tests the methods of the Storage class that don't rely on an implementation
+"""
+
+__author__		= "Chris Nasr"
+__copyright__	= "Ouroboros Coding Inc."
+__email__		= "chris@ouroboroscoding.com"
+__created__		= "2026-10-15"
+
+# Python imports
+import unittest
+
+# Local imports
+from record import Storage
+
+class RevisionGenerate(unittest.TestCase):
+	"""Revision Generate
+
+	Tests Storage.revision_generate
+	"""
+
+	def test_equal(self):
+		"""Equal
+
+		Makes sure identical values generate no changes, including empty \
+		dicts and lists
+		"""
+
+		self.assertIsNone(Storage.revision_generate(1, 1))
+		self.assertIsNone(Storage.revision_generate('a', 'a'))
+		self.assertIsNone(Storage.revision_generate({}, {}))
+		self.assertIsNone(Storage.revision_generate([], []))
+		self.assertIsNone(Storage.revision_generate(
+			{ 'a': {}, 'b': [], 'c': { 'd': [ 1, { 'e': 2 } ] } },
+			{ 'a': {}, 'b': [], 'c': { 'd': [ 1, { 'e': 2 } ] } }
+		))
+
+	def test_single_values(self):
+		"""Single Values
+
+		Makes sure differing single values, and values of differing types, \
+		are marked as changed
+		"""
+
+		self.assertEqual(
+			Storage.revision_generate(1, 2),
+			{ 'old': 1, 'new': 2 }
+		)
+		self.assertEqual(
+			Storage.revision_generate({ 'a': 1 }, [ 1 ]),
+			{ 'old': { 'a': 1 }, 'new': [ 1 ] }
+		)
+		self.assertEqual(
+			Storage.revision_generate([ 1 ], 'a'),
+			{ 'old': [ 1 ], 'new': 'a' }
+		)
+
+	def test_dicts(self):
+		"""Dicts
+
+		Makes sure changed, removed, added, and nested keys are found
+		"""
+
+		self.assertEqual(
+			Storage.revision_generate(
+				{ 'a': 1, 'b': 2, 'c': 3, 'd': { 'e': 4, 'f': 5 }, 'h': 8 },
+				{ 'a': 1, 'b': 9, 'd': { 'e': 4, 'f': 6 }, 'g': 7, 'h': 8 }
+			),
+			{
+				'b': { 'old': 2, 'new': 9 },
+				'c': { 'old': 3, 'new': None },
+				'd': { 'f': { 'old': 5, 'new': 6 } },
+				'g': { 'old': None, 'new': 7 }
+			}
+		)
+
+	def test_lists(self):
+		"""Lists
+
+		Makes sure changed, removed, added, and nested indexes are found, \
+		and stored under string keys
+		"""
+
+		# Changed and nested
+		self.assertEqual(
+			Storage.revision_generate(
+				[ 1, 2, [ 3, 4 ], { 'a': 5, 'b': 6 } ],
+				[ 1, 9, [ 3, 8 ], { 'a': 5, 'b': 7 } ]
+			),
+			{
+				'1': { 'old': 2, 'new': 9 },
+				'2': { '1': { 'old': 4, 'new': 8 } },
+				'3': { 'b': { 'old': 6, 'new': 7 } }
+			}
+		)
+
+		# Removed
+		self.assertEqual(
+			Storage.revision_generate([ 1, 2, 3 ], [ 1, 2 ]),
+			{ '2': { 'old': 3, 'new': None } }
+		)
+
+		# Added
+		self.assertEqual(
+			Storage.revision_generate([ 1, 2 ], [ 1, 2, 3 ]),
+			{ '2': { 'old': None, 'new': 3 } }
+		)
+
+	def test_all_changed(self):
+		"""All Changed
+
+		Makes sure that if every key or index is different, the entire value \
+		is marked as changed instead of each key
+		"""
+
+		self.assertEqual(
+			Storage.revision_generate({ 'a': 1, 'b': 2 }, { 'a': 3, 'c': 4 }),
+			{ 'old': { 'a': 1, 'b': 2 }, 'new': { 'a': 3, 'c': 4 } }
+		)
+		self.assertEqual(
+			Storage.revision_generate([ 1, 2 ], [ 3, 4, 5 ]),
+			{ 'old': [ 1, 2 ], 'new': [ 3, 4, 5 ] }
+		)
+		self.assertEqual(
+			Storage.revision_generate(
+				{ 'a': 1, 'b': { 'c': 2 } },
+				{ 'a': 1, 'b': { 'c': 3 } }
+			),
+			{ 'b': { 'old': { 'c': 2 }, 'new': { 'c': 3 } } }
+		)
+		self.assertEqual(
+			Storage.revision_generate({}, { 'a': 1 }),
+			{ 'old': {}, 'new': { 'a': 1 } }
+		)
+
+	def test_key_order(self):
+		"""Key Order
+
+		Makes sure the changes are in the order of the keys in old, followed \
+		by any keys only in new
+		"""
+
+		dChanges = Storage.revision_generate(
+			{ 'z': 1, 'y': { 'a': 1, 'b': 1 }, 'x': 1, 'w': 1 },
+			{ 'v': 1, 'w': 2, 'x': 1, 'y': { 'a': 2, 'b': 1 }, 'z': 2 }
+		)
+		self.assertEqual(list(dChanges.keys()), [ 'z', 'y', 'w', 'v' ])
+
+		dChanges = Storage.revision_generate(
+			[ 1, 2, 3, 4 ],
+			[ 9, 2, 9 ]
+		)
+		self.assertEqual(list(dChanges.keys()), [ '0', '2', '3' ])
+
+	def test_unchanged_below_change(self):
+		"""Unchanged Below Change
+
+		Makes sure dicts and lists that are equal, but are inside a field that \
+		has changed, generate no changes
+		"""
+
+		self.assertEqual(
+			Storage.revision_generate(
+				{ 'a': { 'b': {}, 'c': [], 'd': { 'e': [ 1 ] }, 'f': 1 }, 'x': 1 },
+				{ 'a': { 'b': {}, 'c': [], 'd': { 'e': [ 1 ] }, 'f': 2 }, 'x': 1 }
+			),
+			{ 'a': { 'f': { 'old': 1, 'new': 2 } } }
+		)
+
+	def test_compare_fails(self):
+		"""Compare Fails
+
+		Makes sure values that raise when compared are marked as changed, and \
+		dicts holding them are still walked
+		"""
+
+		class Raises(object):
+			def __eq__(self, other):
+				raise TypeError('can not compare')
+
+		oOld = Raises()
+		oNew = Raises()
+		self.assertEqual(
+			Storage.revision_generate(
+				{ 'a': { 'b': oOld, 'c': 1 }, 'x': 1 },
+				{ 'a': { 'b': oNew, 'c': 1 }, 'x': 1 }
+			),
+			{ 'a': { 'b': { 'old': oOld, 'new': oNew } } }
+		)
+
+	def test_deep(self):
+		"""Deep
+
+		Makes sure records nested deeper than the recursion limit can still \
+		be compared
+		"""
+
+		# Build two records with the only difference at the bottom
+		dOld = {}
+		dNew = {}
+		dO = dOld
+		dN = dNew
+		for i in range(5000):
+			dO['a'] = i
+			dN['a'] = i
+			dO['b'] = {}
+			dN['b'] = {}
+			dO = dO['b']
+			dN = dN['b']
+		dO['c'] = 1
+		dN['c'] = 2
+		dO['d'] = 3
+		dN['d'] = 3
+
+		# Walk down the changes to the bottom
+		dChanges = Storage.revision_generate(dOld, dNew)
+		for i in range(5000):
+			self.assertEqual(list(dChanges.keys()), [ 'b' ])
+			dChanges = dChanges['b']
+		self.assertEqual(dChanges, { 'c': { 'old': 1, 'new': 2 } })